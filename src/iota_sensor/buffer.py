@@ -25,24 +25,76 @@ class Buffer:
 
     def add(self, data):
         """ Add data to buffer. """
-        content_hash = hashlib.sha1(data).hexdigest()
+        self.add_many([data])
+
+    def add_many(self, items):
+        """
+        Add several bytes-like items to the buffer at once. Items are viewed
+        as flat byte buffers so they're written without being copied. Every
+        item is checked before anything is written, so an invalid item leaves
+        the buffer untouched.
+        """
+        items = [_as_bytes(item) for item in items]
+        content_hashes = [hashlib.sha1(data).hexdigest() for data in items]
+        for data, content_hash in zip(items, content_hashes):
+            self._write(data, content_hash)
+
+    def _write(self, data, content_hash):
         now = datetime.utcnow().timestamp()
         file_name = '{}_{}'.format(now, content_hash)
-        with open(os.path.join(self.directory, file_name), 'wb') as fh:
-            fh.write(data)
+        suffix = 0
+        while True:
+            try:
+                fd = os.open(os.path.join(self.directory, file_name),
+                             os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                break
+            except FileExistsError:
+                # identical item buffered within the same clock tick
+                suffix += 1
+                file_name = '{}_{}_{}'.format(now, content_hash, suffix)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
-    def read(self):
+    def read_raw(self):
         """
-        Read each item of the buffer into a list. It's assumed buffer files
-        contain valid JSON.
+        Read each item of the buffer into a list of the bytes stored on disk,
+        without decoding them.
         """
         data = []
         for root, subdirs, files in os.walk(self.directory):
             for file_path in files:
-                with open(os.path.join(root, file_path), 'r') as fh:
-                    data.append(json.loads(fh.read()))
+                with open(os.path.join(root, file_path), 'rb') as fh:
+                    data.append(fh.read())
         return data
 
+    def read(self):
+        """
+        Read each item of the buffer into a list. It's assumed buffer files
+        contain valid JSON.
+        """
+        return [json.loads(item.decode('utf-8')) for item in self.read_raw()]
+
+    def read_json(self, validate=False):
+        """
+        Read the buffer as a serialised JSON array, reusing the stored bytes
+        instead of decoding and re-encoding them. Empty items raise
+        `ValueError` and non-ASCII items are re-escaped. With `validate`, each
+        item is also fully parsed so malformed JSON raises `ValueError`.
+        """
+        data = []
+        for item in self.read_raw():
+            if not item.strip():
+                raise ValueError('Empty item in buffer.')
+            if validate or not item.isascii():
+                decoded = json.loads(item.decode('utf-8'))
+                if not item.isascii():
+                    item = json.dumps(decoded).encode('ascii')
+            data.append(item)
+        return b'[' + b', '.join(data) + b']'
+
     def clear(self):
         """ Remove all files from the buffer `directory`. """
         for root, subdirs, files in os.walk(self.directory):
@@ -71,3 +123,11 @@ class Buffer:
                 ' the `size` variable under [buffer].'
             ))
         return cls(arguments.buffer_directory, arguments.buffer_size)
+
+
+def _as_bytes(item):
+    """ View a bytes-like `item` as a flat, unsigned byte buffer. """
+    data = memoryview(item)
+    if not data.c_contiguous:
+        raise ValueError('Buffer items must be C-contiguous.')
+    return data.cast('B')
@@ -14,6 +14,7 @@ from .cli import configure_argument_parser
 from .exceptions import InvalidParameter
 from .netatmo import APIClient, get_sensor_options
 from .sender import get_iota_options, attach_encrypted_message
+from .transaction import build_transaction_data
 from .mam_encryption import get_mam_options
 
 
@@ -49,13 +50,10 @@ def main():
     file_buffer.add(json.dumps(sensor_data).encode('ascii'))
     if not file_buffer.is_ready:
         return
-    sensor_data = file_buffer.read()
 
     # tag the transaction with the configured price
-    transaction_data = json.dumps({
-        'price': iota_options.price,
-        'data': sensor_data
-    }).encode('ascii')
+    transaction_data = build_transaction_data(iota_options.price,
+                                              file_buffer.read_json())
 
     # encode data and attach it to the IOTA tangle
     attach_encrypted_message(
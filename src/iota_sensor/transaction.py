@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Build the message attached to the Tangle from buffered sensor data.
+"""
+import json
+
+
+def build_transaction_data(price, sensor_data):
+    """
+    Serialise the transaction message. `sensor_data` is the buffer contents
+    as an already serialised JSON array, which is spliced in as-is.
+    """
+    return b''.join([
+        b'{"price": ',
+        json.dumps(price).encode('ascii'),
+        b', "data": ',
+        sensor_data,
+        b'}',
+    ])
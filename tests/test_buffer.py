@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import array
+import json
+
+from datetime import datetime
+
+import pytest
+
+from iota_sensor import buffer
+from iota_sensor.buffer import Buffer
+
+
+SAMPLES = [
+    {'temperature': 21.5, 'place': {'location': [3.1, -1.2]}},
+    [1, 2, 3],
+    'ascii only',
+]
+
+
+@pytest.fixture
+def file_buffer(tmpdir):
+    return Buffer(str(tmpdir.join('buffer')), 3)
+
+
+def test_add_many_accepts_bytes_like_items(file_buffer):
+    ints = array.array('i', range(1000))
+    items = [b'bytes', bytearray(b'bytearray'), memoryview(b'memoryview'),
+             ints, memoryview(ints.tobytes()).cast('i', (10, 100))]
+    file_buffer.add_many(items)
+    assert sorted(file_buffer.read_raw()) == sorted(
+        bytes(memoryview(item).cast('B')) for item in items
+    )
+
+
+def test_add_many_rejects_non_contiguous_items(file_buffer):
+    with pytest.raises(ValueError):
+        file_buffer.add_many([b'valid', memoryview(b'abcdef')[::2]])
+    assert file_buffer.read_raw() == []
+
+
+def test_add_many_keeps_duplicates_from_the_same_tick(file_buffer,
+                                                      monkeypatch):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime(2018, 1, 1)
+
+    monkeypatch.setattr(buffer, 'datetime', FrozenDatetime)
+    file_buffer.add_many([b'[1]', b'[1]', b'[1]'])
+    assert file_buffer.read_raw() == [b'[1]'] * 3
+    assert file_buffer.is_ready
+
+
+def test_add_many_empty_batch(file_buffer):
+    file_buffer.add_many([])
+    assert file_buffer.read_raw() == []
+    assert not file_buffer.is_ready
+
+
+def test_read_decodes_items(file_buffer):
+    file_buffer.add_many(json.dumps(item).encode('ascii') for item in SAMPLES)
+    assert file_buffer.is_ready
+    assert sorted(map(json.dumps, file_buffer.read())) == sorted(
+        map(json.dumps, SAMPLES)
+    )
+
+
+@pytest.mark.parametrize('samples', [[], SAMPLES[:1], SAMPLES])
+def test_read_json_matches_dumps(file_buffer, samples):
+    for item in samples:
+        file_buffer.add(json.dumps(item).encode('ascii'))
+    assert file_buffer.read_json() == json.dumps(
+        file_buffer.read()
+    ).encode('ascii')
+
+
+def test_read_json_escapes_non_ascii_items(file_buffer):
+    file_buffer.add(json.dumps({'t': u'\xe9'}, ensure_ascii=False)
+                    .encode('utf-8'))
+    assert file_buffer.read_json() == b'[{"t": "\\u00e9"}]'
+    assert json.loads(file_buffer.read_json().decode('ascii')) == \
+        file_buffer.read()
+
+
+@pytest.mark.parametrize('content', [b'', b' \n'])
+def test_read_json_rejects_empty_items(file_buffer, content):
+    file_buffer.add(b'{"valid": true}')
+    file_buffer.add(content)
+    with pytest.raises(ValueError):
+        file_buffer.read_json()
+
+
+@pytest.mark.parametrize('content', [b'{"truncated": ', b'\xff'])
+def test_read_json_validate_rejects_invalid_items(file_buffer, content):
+    file_buffer.add(b'{"valid": true}')
+    file_buffer.add(content)
+    with pytest.raises(ValueError):
+        file_buffer.read_json(validate=True)
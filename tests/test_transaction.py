@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from iota_sensor.buffer import Buffer
+from iota_sensor.transaction import build_transaction_data
+
+
+SAMPLES = [
+    {'temperature': 21.5, 'place': {'location': [3.1, -1.2]}},
+    [1, 2, 3],
+    'ascii only',
+]
+
+
+@pytest.fixture
+def file_buffer(tmpdir):
+    return Buffer(str(tmpdir.join('buffer')), 3)
+
+
+@pytest.mark.parametrize('price', [0, 10, 2.5])
+@pytest.mark.parametrize('samples', [[], SAMPLES[:1], SAMPLES])
+def test_build_transaction_data_matches_dumps(file_buffer, price, samples):
+    for item in samples:
+        file_buffer.add(json.dumps(item).encode('ascii'))
+    transaction_data = build_transaction_data(price, file_buffer.read_json())
+    assert transaction_data == json.dumps({
+        'price': price,
+        'data': file_buffer.read(),
+    }).encode('ascii')